@@ -2,224 +2,265 @@
 """
 OpenAPI 到 Mintlify MDX 转换器（简化版）
 自动将 OpenAPI YAML 文件转换为 Mintlify MDX 格式的 API 文档页面
-使用标准库，无需额外依赖
+使用标准库，无需额外依赖；若已安装 PyYAML / orjson 则优先使用其 C 加速实现
 """
 
+import functools
 import json
+import os
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any
-
-def parse_yaml_basic(content: str) -> Dict[str, Any]:
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:  # 未安装 PyYAML 时回退到内置的简化解析器
+    yaml = None
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时使用标准库 json 输出
+    orjson = None
+
+# 文件名清理用的正则（预编译）
+_SANITIZE_BAD = re.compile(r'[^\w\u4e00-\u9fff\-]')
+_SANITIZE_DASHES = re.compile(r'-+')
+
+# 简化解析器识别的 HTTP 方法行 -> 方法名
+_HTTP_METHOD_LINES = {
+    b'get:': 'get',
+    b'post:': 'post',
+    b'put:': 'put',
+    b'delete:': 'delete',
+    b'patch:': 'patch',
+}
+
+def parse_yaml_basic(lines: Iterable[bytes]) -> Dict[str, Any]:
     """简单的 YAML 解析器（仅用于基本结构）"""
     # 这是一个简化的解析器，仅用于提取基本的路径信息
-    lines = content.split('\n')
-    paths = {}
+    # 逐行扫描原始字节，只对需要保存的值做 UTF-8 解码
+    paths = defaultdict(dict)
     current_path = None
     current_method = None
     current_operation = {}
     in_tags = False
     tags = []
 
+    def flush():
+        """保存当前正在解析的操作"""
+        if current_path and current_method:
+            paths[current_path][current_method] = current_operation
+
     for line in lines:
         line_stripped = line.strip()
 
         # 匹配路径
-        if line_stripped.startswith('/') and line_stripped.endswith(':'):
-            if current_path and current_method:
-                if current_path not in paths:
-                    paths[current_path] = {}
-                paths[current_path][current_method] = current_operation
+        if line_stripped.startswith(b'/') and line_stripped.endswith(b':'):
+            flush()
 
-            current_path = line_stripped[:-1]  # 移除末尾的冒号
+            current_path = line_stripped[:-1].decode('utf-8')  # 移除末尾的冒号
             current_method = None
             current_operation = {}
             in_tags = False
             tags = []
 
         # 匹配 HTTP 方法
-        elif line_stripped in ['get:', 'post:', 'put:', 'delete:', 'patch:']:
-            if current_path and current_method:
-                if current_path not in paths:
-                    paths[current_path] = {}
-                paths[current_path][current_method] = current_operation
+        elif line_stripped in _HTTP_METHOD_LINES:
+            flush()
 
-            current_method = line_stripped[:-1]  # 移除末尾的冒号
+            current_method = _HTTP_METHOD_LINES[line_stripped]
             current_operation = {}
             in_tags = False
             tags = []
 
         # 匹配 tags 开始
-        elif line_stripped == 'tags:':
+        elif line_stripped == b'tags:':
             in_tags = True
             tags = []
 
         # 匹配 tags 内容
-        elif in_tags and line_stripped.startswith('- '):
-            tag_name = line_stripped[2:].strip()
+        elif in_tags and line_stripped.startswith(b'- '):
+            tag_name = line_stripped[2:].strip().decode('utf-8')
             tags.append(tag_name)
 
         # 其他字段结束 tags 解析
-        elif line_stripped and not line_stripped.startswith('- ') and not line_stripped.startswith(' ') and in_tags:
+        elif line_stripped and not line_stripped.startswith(b'- ') and not line_stripped.startswith(b' ') and in_tags:
             in_tags = False
             current_operation['tags'] = tags
 
         # 匹配 summary
-        elif line_stripped.startswith('summary:'):
+        elif line_stripped.startswith(b'summary:'):
             if in_tags:
                 in_tags = False
                 current_operation['tags'] = tags
-            summary = line_stripped[8:].strip().strip('\'"')
+            summary = line_stripped[8:].strip().strip(b'\'"').decode('utf-8')
             current_operation['summary'] = summary
 
         # 匹配 description
-        elif line_stripped.startswith('description:'):
+        elif line_stripped.startswith(b'description:'):
             if in_tags:
                 in_tags = False
                 current_operation['tags'] = tags
-            desc = line_stripped[11:].strip().strip('\'"')
+            desc = line_stripped[11:].strip().strip(b'\'"').decode('utf-8')
             current_operation['description'] = desc
 
     # 处理最后一个操作
-    if current_path and current_method:
-        if in_tags:
-            current_operation['tags'] = tags
-        if current_path not in paths:
-            paths[current_path] = {}
-        paths[current_path][current_method] = current_operation
+    if in_tags:
+        current_operation['tags'] = tags
+    flush()
 
-    return {'paths': paths}
+    return {'paths': dict(paths)}
 
 def load_openapi_spec(file_path: str) -> Dict[str, Any]:
     """加载 OpenAPI 规范文件"""
+    if yaml is None:
+        print("⚠️  警告：未安装 PyYAML，改用简化解析器，生成的页面可能不完整或与完整解析结果不同")
+        print("   安装 PyYAML 以获得准确结果：pip install pyyaml")
+        with open(file_path, 'rb') as f:
+            return parse_yaml_basic(f)
+
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    return parse_yaml_basic(content)
+    # 优先使用 libyaml 的 C 加载器，不可用时退回纯 Python 实现
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(content, Loader=loader) or {}
 
 def sanitize_filename(name: str) -> str:
     """清理文件名，移除特殊字符"""
     # 移除特殊字符，保留中文、英文、数字和连字符
-    name = re.sub(r'[^\w\u4e00-\u9fff\-]', '-', name)
+    name = _SANITIZE_BAD.sub('-', name)
     # 移除多余的连字符
-    name = re.sub(r'-+', '-', name)
+    name = _SANITIZE_DASHES.sub('-', name)
     # 移除开头和结尾的连字符
     name = name.strip('-')
     return name.lower()
 
+def _openai_category(main_tag: str) -> str:
+    """细分 OpenAI 标签的分类"""
+    if 'gpt 4o' in main_tag:
+        return 'openai-gpt4o'
+    elif 'gpt' in main_tag or 'reasoning' in main_tag:
+        return 'openai-gpt'
+    elif 'audio' in main_tag:
+        return 'openai-audio'
+    else:
+        return 'openai'
+
+def _gemini_category(main_tag: str) -> str:
+    """细分 Gemini 标签的分类"""
+    if 'veo3' in main_tag or 'video' in main_tag:
+        return 'gemini-veo'
+    else:
+        return 'gemini'
+
+# 标签关键字 -> 分类（按顺序匹配，值可以是分类名或细分函数）
+_TAG_RULES = (
+    ('openai', _openai_category),
+    ('claude', 'claude'),
+    ('gemini', _gemini_category),
+    ('grok', 'grok'),
+    ('midjourney', 'midjourney'),
+    ('suno', 'suno'),
+    ('kling', 'kling'),
+    ('runway', 'runway'),
+    ('ideogram', 'ideogram'),
+    ('flux', 'flux'),
+    ('doubao', 'doubao'),
+    ('higgsfield', 'higgsfield'),
+    ('qwen', 'qwen'),
+    ('minimax', 'minimax'),
+)
+
+# 路径关键字 -> 分类（按顺序匹配）
+_PATH_RULES = (
+    ('/chat/', 'openai-gpt'),
+    ('/images/', 'image-models'),
+    ('/audio/', 'audio-models'),
+    ('/veo/', 'gemini-veo'),
+    ('/mj/', 'midjourney'),
+    ('gemini', 'gemini'),
+    ('/upload/', 'file-services'),
+    ('/files', 'file-services'),
+    ('/task', 'task-services'),
+)
+
+@functools.lru_cache(maxsize=None)
+def _tag_category(tag: str) -> Optional[str]:
+    """根据标签确定模型分类，无法识别时返回 None（结果按标签缓存）"""
+    main_tag = tag.lower()
+
+    # 提取主要模型名称
+    for needle, target in _TAG_RULES:
+        if needle in main_tag:
+            return target(main_tag) if callable(target) else target
+
+    return None
+
 def get_endpoint_category(path: str, tags: List[str]) -> str:
     """根据标签和路径确定模型分类"""
-    # 如果有标签，优先使用标签确定分类
+    # 如果有标签，优先使用标签确定分类（使用第一个标签）
     if tags:
-        main_tag = tags[0].lower()  # 使用第一个标签
-
-        # 提取主要模型名称
-        if 'openai' in main_tag:
-            if 'gpt 4o' in main_tag:
-                return 'openai-gpt4o'
-            elif 'gpt' in main_tag or 'reasoning' in main_tag:
-                return 'openai-gpt'
-            elif 'audio' in main_tag:
-                return 'openai-audio'
-            else:
-                return 'openai'
-        elif 'claude' in main_tag:
-            return 'claude'
-        elif 'gemini' in main_tag:
-            if 'veo3' in main_tag or 'video' in main_tag:
-                return 'gemini-veo'
-            else:
-                return 'gemini'
-        elif 'grok' in main_tag:
-            return 'grok'
-        elif 'midjourney' in main_tag:
-            return 'midjourney'
-        elif 'suno' in main_tag:
-            return 'suno'
-        elif 'kling' in main_tag:
-            return 'kling'
-        elif 'runway' in main_tag:
-            return 'runway'
-        elif 'ideogram' in main_tag:
-            return 'ideogram'
-        elif 'flux' in main_tag:
-            return 'flux'
-        elif 'doubao' in main_tag:
-            return 'doubao'
-        elif 'higgsfield' in main_tag:
-            return 'higgsfield'
-        elif 'qwen' in main_tag:
-            return 'qwen'
-        elif 'minimax' in main_tag:
-            return 'minimax'
+        category = _tag_category(tags[0])
+        if category is not None:
+            return category
 
     # 如果没有标签或无法从标签识别，使用路径判断
     path_lower = path.lower()
 
-    if '/chat/' in path_lower:
-        return 'openai-gpt'
-    elif '/images/' in path_lower:
-        return 'image-models'
-    elif '/audio/' in path_lower:
-        return 'audio-models'
-    elif '/veo/' in path_lower:
-        return 'gemini-veo'
-    elif '/mj/' in path_lower:
-        return 'midjourney'
-    elif 'gemini' in path_lower:
-        return 'gemini'
-    elif '/upload/' in path_lower or '/files' in path_lower:
-        return 'file-services'
-    elif '/task' in path_lower:
-        return 'task-services'
-    else:
-        return 'other'
+    for needle, category in _PATH_RULES:
+        if needle in path_lower:
+            return category
 
-def generate_endpoint_mdx(path: str, method: str, operation: Dict[str, Any]) -> str:
-    """为单个端点生成 MDX 内容"""
+    return 'other'
 
-    # 获取基本信息
-    summary = operation.get('summary', f'{method.upper()} {path}')
-    description = operation.get('description', f'{method.upper()} {path} 接口')
-    tags = operation.get('tags', [])
+# 示例代码模板（cURL / Python / JavaScript），通过 str.format 填充
+_EXAMPLES_TEMPLATE = """### cURL 示例
 
-    # 构建 OpenAPI 引用
-    openapi_ref = f'"{method.upper()} {path}"'
+```bash
+curl -X {mu} "http://129.226.58.30{path}" \\
+  -H "Authorization: Bearer YOUR_API_KEY" \\
+  -H "Content-Type: application/json"
+```
 
-    # 生成搜索关键词
-    search_keywords = []
-    search_keywords.extend(tags)  # 添加标签作为关键词
-    search_keywords.append(method.upper())  # 添加HTTP方法
+### Python 示例
 
-    # 从路径提取关键词
-    path_parts = [part for part in path.split('/') if part and not part.startswith('v')]
-    search_keywords.extend(path_parts)
+```python
+import requests
 
-    # 从summary提取关键词
-    if summary:
-        search_keywords.extend(summary.split())
+url = "http://129.226.58.30{path}"
+headers = {{
+    "Authorization": "Bearer YOUR_API_KEY",
+    "Content-Type": "application/json"
+}}
 
-    # 去重并清理关键词
-    search_keywords = list(set([kw.strip().lower() for kw in search_keywords if kw.strip()]))
-    keywords_str = ', '.join(search_keywords)
+response = requests.{ml}(url, headers=headers)
+print(response.json())
+```
 
-    # 增强描述信息
-    enhanced_description = description
-    if tags:
-        main_tag = tags[0]
-        if 'openai' in main_tag.lower():
-            enhanced_description += " - OpenAI API兼容接口"
-        elif 'gemini' in main_tag.lower():
-            enhanced_description += " - Google Gemini模型接口"
-        elif 'midjourney' in main_tag.lower():
-            enhanced_description += " - Midjourney图像生成接口"
-        elif 'suno' in main_tag.lower():
-            enhanced_description += " - Suno AI音乐生成接口"
-
-    # 生成 frontmatter
-    frontmatter = f"""---
-title: "{summary}"
-description: "{enhanced_description}"
+### JavaScript 示例
+
+```javascript
+const response = await fetch('http://129.226.58.30{path}', {{
+  method: '{mu}',
+  headers: {{
+    'Authorization': 'Bearer YOUR_API_KEY',
+    'Content-Type': 'application/json'
+  }}
+}});
+
+const data = await response.json();
+console.log(data);
+```"""
+
+# 端点 MDX 页面模板（frontmatter + 正文），通过 str.format_map 填充
+# frontmatter 中的字符串值已由 json.dumps 加上引号并转义
+_ENDPOINT_MDX_TEMPLATE = """---
+title: {title_json}
+description: {description_json}
 openapi: {openapi_ref}
 mode: "wide"
 ---
@@ -228,19 +269,16 @@ mode: "wide"
 **搜索关键词**: {keywords_str}
 </Info>
 
-"""
-
-    # 生成主要内容
-    content = f"""# {summary}
+# {summary}
 
 {enhanced_description}
 
 ## 接口信息
 
-- **请求方法**: `{method.upper()}`
+- **请求方法**: `{mu}`
 - **接口路径**: `{path}`
 - **认证方式**: Bearer Token
-- **标签**: {', '.join(tags) if tags else '无'}
+- **标签**: {tags_joined}
 
 ## 认证说明
 
@@ -260,99 +298,177 @@ Authorization: Bearer YOUR_API_KEY
 
 ## 示例代码
 
-### cURL 示例
+{examples}
 
-```bash
-curl -X {method.upper()} "http://129.226.58.30{path}" \\
-  -H "Authorization: Bearer YOUR_API_KEY" \\
-  -H "Content-Type: application/json"
-```
+## 相关接口
 
-### Python 示例
+搜索相关标签: {tags_backticked}
 
-```python
-import requests
+"""
 
-url = "http://129.226.58.30{path}"
-headers = {{
-    "Authorization": "Bearer YOUR_API_KEY",
-    "Content-Type": "application/json"
-}}
+# 标签关键字 -> 描述后缀（按顺序匹配）
+_DESC_SUFFIXES = (
+    ('openai', " - OpenAI API兼容接口"),
+    ('gemini', " - Google Gemini模型接口"),
+    ('midjourney', " - Midjourney图像生成接口"),
+    ('suno', " - Suno AI音乐生成接口"),
+)
 
-response = requests.{method.lower()}(url, headers=headers)
-print(response.json())
-```
-
-### JavaScript 示例
+def generate_endpoint_mdx(path: str, method: str, operation: Dict[str, Any]) -> str:
+    """为单个端点生成 MDX 内容"""
 
-```javascript
-const response = await fetch('http://129.226.58.30{path}', {{
-  method: '{method.upper()}',
-  headers: {{
-    'Authorization': 'Bearer YOUR_API_KEY',
-    'Content-Type': 'application/json'
-  }}
-}});
+    # 获取基本信息
+    mu = method.upper()
+    summary = operation.get('summary', f'{mu} {path}')
+    description = operation.get('description', f'{mu} {path} 接口')
+    tags = operation.get('tags', [])
 
-const data = await response.json();
-console.log(data);
-```
+    # 构建 OpenAPI 引用
+    openapi_ref = json.dumps(f'{mu} {path}', ensure_ascii=False)
 
-## 相关接口
+    # 生成搜索关键词
+    search_keywords = []
+    search_keywords.extend(tags)  # 添加标签作为关键词
+    search_keywords.append(mu)  # 添加HTTP方法
 
-搜索相关标签: {', '.join([f'`{tag}`' for tag in tags]) if tags else '无'}
+    # 从路径提取关键词
+    path_parts = [part for part in path.split('/') if part and not part.startswith('v')]
+    search_keywords.extend(path_parts)
 
-"""
+    # 从summary提取关键词
+    if summary:
+        search_keywords.extend(summary.split())
 
-    return frontmatter + content
+    # 去重并清理关键词
+    # 按首次出现的顺序保留，使输出稳定可复现
+    seen = set()
+    search_keywords = [
+        sys.intern(kw) for kw in (raw.strip().lower() for raw in search_keywords)
+        if kw and not (kw in seen or seen.add(kw))
+    ]
+    keywords_str = ', '.join(search_keywords)
 
-def create_directory_structure(base_path: str, categories: set) -> None:
+    # 增强描述信息
+    enhanced_description = description
+    if tags:
+        main_tag = tags[0].lower()
+        for needle, suffix in _DESC_SUFFIXES:
+            if needle in main_tag:
+                enhanced_description += suffix
+                break
+
+    # 生成 MDX 内容
+    return _ENDPOINT_MDX_TEMPLATE.format_map({
+        'summary': summary,
+        'title_json': json.dumps(summary, ensure_ascii=False),
+        'enhanced_description': enhanced_description,
+        'description_json': json.dumps(enhanced_description, ensure_ascii=False),
+        'openapi_ref': openapi_ref,
+        'keywords_str': keywords_str,
+        'mu': mu,
+        'path': path,
+        'examples': _EXAMPLES_TEMPLATE.format(mu=mu, ml=method.lower(), path=path),
+        'tags_joined': ', '.join(tags) if tags else '无',
+        'tags_backticked': ', '.join([f'`{tag}`' for tag in tags]) if tags else '无',
+    })
+
+def create_directory_structure(base_path: str, categories: Iterable[str]) -> None:
     """创建目录结构"""
     base = Path(base_path)
     for category in categories:
         category_path = base / category
         category_path.mkdir(parents=True, exist_ok=True)
 
+def write_file_bytes(file_path: str, data: bytes) -> None:
+    """将已编码的内容直接写入文件描述符，绕过文本 IO 层"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(file_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write 可能只写入部分数据
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def read_file_bytes(file_path: str) -> Optional[bytes]:
+    """读取文件的原始字节，文件不存在或无法读取时返回 None"""
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def write_json_file(file_path: str, data: Any) -> None:
+    """以 UTF-8、两空格缩进写出 JSON，已安装 orjson 时优先使用"""
+    if orjson is not None:
+        write_file_bytes(file_path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+def emit_endpoint_file(category_dir: str, endpoint: Dict[str, Any]) -> Tuple[str, bool]:
+    """生成单个端点的 MDX 内容并写入文件
+
+    磁盘上已有文件与生成内容逐字节一致时跳过写入。
+    返回 (文件路径, 是否写入)。
+    """
+    # 生成 MDX 内容
+    mdx_content = generate_endpoint_mdx(
+        endpoint['path'],
+        endpoint['method'],
+        endpoint['operation']
+    )
+    data = mdx_content.encode('utf-8')
+
+    # 写入文件（与磁盘上现有内容一致时跳过）
+    file_path = f"{category_dir}{os.sep}{endpoint['filename']}.mdx"
+    if read_file_bytes(file_path) == data:
+        return file_path, False
+
+    write_file_bytes(file_path, data)
+
+    return file_path, True
+
+# 分类 -> 导航分组名称
+_CATEGORY_NAMES = {
+    'openai': 'OpenAI',
+    'openai-gpt': 'OpenAI GPT Series',
+    'openai-gpt4o': 'OpenAI GPT-4o',
+    'openai-audio': 'OpenAI Audio',
+    'claude': 'Claude',
+    'gemini': 'Gemini',
+    'gemini-veo': 'Gemini Veo Video',
+    'grok': 'Grok',
+    'midjourney': 'Midjourney',
+    'suno': 'Suno Music',
+    'kling': 'Kling Video',
+    'runway': 'Runway',
+    'ideogram': 'Ideogram',
+    'flux': 'Flux',
+    'doubao': 'Doubao',
+    'higgsfield': 'Higgsfield',
+    'qwen': 'Qwen',
+    'minimax': 'MiniMax',
+    'image-models': 'Image Generation Models',
+    'audio-models': 'Audio Processing Models',
+    'file-services': 'File Services',
+    'task-services': 'Task Management',
+    'other': 'Other APIs'
+}
+
 def generate_navigation_config(endpoints_by_category: Dict[str, List[Dict]]) -> List[Dict[str, Any]]:
     """生成导航配置"""
 
-    category_names = {
-        'openai': 'OpenAI',
-        'openai-gpt': 'OpenAI GPT Series',
-        'openai-gpt4o': 'OpenAI GPT-4o',
-        'openai-audio': 'OpenAI Audio',
-        'claude': 'Claude',
-        'gemini': 'Gemini',
-        'gemini-veo': 'Gemini Veo Video',
-        'grok': 'Grok',
-        'midjourney': 'Midjourney',
-        'suno': 'Suno Music',
-        'kling': 'Kling Video',
-        'runway': 'Runway',
-        'ideogram': 'Ideogram',
-        'flux': 'Flux',
-        'doubao': 'Doubao',
-        'higgsfield': 'Higgsfield',
-        'qwen': 'Qwen',
-        'minimax': 'MiniMax',
-        'image-models': 'Image Generation Models',
-        'audio-models': 'Audio Processing Models',
-        'file-services': 'File Services',
-        'task-services': 'Task Management',
-        'other': 'Other APIs'
-    }
-
     navigation_groups = []
 
     for category, endpoints in endpoints_by_category.items():
         if not endpoints:
             continue
 
-        group_name = category_names.get(category, category.title())
-        pages = []
-
-        for endpoint in endpoints:
-            pages.append(f"api-reference/{category}/{endpoint['filename']}")
+        group_name = _CATEGORY_NAMES.get(category) or category.title()
+        prefix = f"api-reference/{category}/"
+        pages = [prefix + endpoint['filename'] for endpoint in endpoints]
 
         navigation_groups.append({
             "group": group_name,
@@ -373,6 +489,11 @@ def main():
     print("📖 加载 OpenAPI 规范...")
     try:
         spec = load_openapi_spec(openapi_file)
+        if not isinstance(spec, dict):
+            raise ValueError("顶层结构必须是映射")
+        paths = spec.get('paths') or {}
+        if not isinstance(paths, dict):
+            raise ValueError("paths 必须是映射")
     except FileNotFoundError:
         print(f"❌ 错误：找不到文件 {openapi_file}")
         return
@@ -381,19 +502,32 @@ def main():
         return
 
     # 解析端点
-    paths = spec.get('paths', {})
-    endpoints_by_category = {}
-    all_categories = set()
+    endpoints_by_category = defaultdict(list)
+    taken_filenames = set()
 
     print(f"📝 发现 {len(paths)} 个 API 端点")
 
     for path, methods in paths.items():
+        # 跳过没有内容或结构不正确的路径项（如 `/b:`）
+        if not isinstance(methods, dict):
+            continue
+
         for method, operation in methods.items():
             if method in ['get', 'post', 'put', 'delete', 'patch']:
+                # 空操作（如 `get:`）按空映射处理，其他非映射值跳过
+                if operation is None:
+                    operation = {}
+                elif not isinstance(operation, dict):
+                    continue
+
+                # 驻留高度重复的字符串（方法、标签、分类），减少内存占用
+                method = sys.intern(method)
+                tags = [sys.intern(tag) for tag in operation.get('tags', [])]
+                if 'tags' in operation:
+                    operation['tags'] = tags
+
                 # 确定分类
-                tags = operation.get('tags', [])
-                category = get_endpoint_category(path, tags)
-                all_categories.add(category)
+                category = sys.intern(get_endpoint_category(path, tags))
 
                 # 生成文件名
                 summary = operation.get('summary', f'{method}-{path}')
@@ -405,16 +539,14 @@ def main():
                     filename = sanitize_filename(filename)
 
                 # 确保文件名唯一
-                base_filename = filename
-                counter = 1
-                while any(ep['filename'] == filename for ep_list in endpoints_by_category.values() for ep in ep_list):
-                    filename = f"{base_filename}-{counter}"
-                    counter += 1
+                if filename in taken_filenames:
+                    base_filename = filename
+                    counter = 1
+                    while (filename := f"{base_filename}-{counter}") in taken_filenames:
+                        counter += 1
+                taken_filenames.add(filename)
 
                 # 添加到分类
-                if category not in endpoints_by_category:
-                    endpoints_by_category[category] = []
-
                 endpoints_by_category[category].append({
                     'path': path,
                     'method': method,
@@ -425,29 +557,34 @@ def main():
 
     # 创建目录结构
     print("📁 创建目录结构...")
+    all_categories = endpoints_by_category.keys()
     create_directory_structure(output_dir, all_categories)
 
     # 生成 MDX 文件
     print("✍️  生成 MDX 文件...")
     total_files = 0
-
-    for category, endpoints in endpoints_by_category.items():
-        print(f"  📂 处理分类: {category}")
-        for endpoint in endpoints:
-            # 生成 MDX 内容
-            mdx_content = generate_endpoint_mdx(
-                endpoint['path'],
-                endpoint['method'],
-                endpoint['operation']
-            )
-
-            # 写入文件
-            file_path = Path(output_dir) / category / f"{endpoint['filename']}.mdx"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(mdx_content)
-
-            total_files += 1
-            print(f"    ✓ {file_path}")
+    written_files = 0
+
+    # 各端点相互独立，并发生成并写入
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures_by_category = {}
+        for category, endpoints in endpoints_by_category.items():
+            category_dir = os.path.join(output_dir, category)
+            futures_by_category[category] = [
+                executor.submit(emit_endpoint_file, category_dir, endpoint) for endpoint in endpoints
+            ]
+
+        for category, futures in futures_by_category.items():
+            print(f"  📂 处理分类: {category}")
+            for future in futures:
+                file_path, written = future.result()
+                total_files += 1
+                if written:
+                    written_files += 1
+                    print(f"    ✓ {file_path}")
+                else:
+                    print(f"    = {file_path}（未变化，跳过）")
 
     # 生成导航配置
     print("🧭 生成导航配置...")
@@ -455,11 +592,10 @@ def main():
 
     # 输出导航配置到文件
     nav_config_file = "generated-navigation.json"
-    with open(nav_config_file, 'w', encoding='utf-8') as f:
-        json.dump(navigation_groups, f, ensure_ascii=False, indent=2)
+    write_json_file(nav_config_file, navigation_groups)
 
     print(f"\n🎉 完成！")
-    print(f"  📄 生成了 {total_files} 个 API 文档页面")
+    print(f"  📄 生成了 {total_files} 个 API 文档页面（写入 {written_files} 个，{total_files - written_files} 个未变化）")
     print(f"  📂 创建了 {len(all_categories)} 个分类目录：{', '.join(sorted(all_categories))}")
     print(f"  🧭 导航配置已保存到 {nav_config_file}")
     print(f"\n下一步：")